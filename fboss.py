@@ -6,10 +6,13 @@ import random
 import string
 import mmap
 import contextlib
+import os
 import re
 import json
+from functools import lru_cache
 from time import sleep
 from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor
 from fboss_utils import *
 import i2cbus
 from spibus import SPIBUS
@@ -49,6 +52,10 @@ MONTBLANC_SPI_DEV = ("iob", "dom1", "dom2", "i210", "scm", "smb", "mcb", "th5")
 TAHAN_SPI_DEV = ("iob", "dom", "i210", "smb_1", "smb_2", "pwr", "th5")
 JANGA_SPI_DEV = ("iob", "dom", "i210", "smb_1", "smb_2", "pwr", "j3a", "j3b")
 
+# Patterns for parsing /etc/BSPVER
+BSP_VER_PATTERN = re.compile(r"BSP_VER\S+", re.M)
+BSP_VER_STRIP_PATTERN = re.compile('["v]')
+
 # Define project stage names
 PROJECT_STAGE = ("EVT1", "EVT2", "EVT3", "DVT1", "DVT2", "PVT", "MP", "TBD")
 
@@ -68,8 +75,9 @@ I2C_BUS_MCBCPLD = "IOB_I2C_BUS_14"
 I2C_ADDR_MCBCPLD = 0x33
 
 
-def platform_data_parse(config_file):
-    """Parses platform data from a JSON configuration file."""
+@lru_cache(maxsize=8)
+def _load_platform_data(config_file, mtime_ns):
+    """Loads a JSON configuration file; mtime_ns only keys the cache."""
     # Open JSON file
     with open(config_file, "r", encoding="utf-8") as fd:
         # Returns JSON object as a dictionary
@@ -78,6 +86,15 @@ def platform_data_parse(config_file):
     return platform_data
 
 
+def platform_data_parse(config_file):
+    """Parses platform data from a JSON configuration file.
+
+    The parsed dict is cached until the file's mtime changes and is shared
+    between callers, so treat it as read-only.
+    """
+    return _load_platform_data(config_file, os.stat(config_file).st_mtime_ns)
+
+
 def get_board_id(platformDict) -> str:
     """Gets the current board type."""
     platform = "NA"
@@ -102,6 +119,14 @@ def get_board_revision():
     return board_rev
 
 
+def _read_fpga_info(fpga_info: str) -> list:
+    """Reads device_id, fpga_ver, board_id and board_rev of an fpga_info device."""
+    return [
+        read_sysfile_value(f"{DEV_PATH}{IOB_PCI_DRIVER}.{fpga_info}/{attr}")
+        for attr in ("device_id", "fpga_ver", "board_id", "board_rev")
+    ]
+
+
 def get_fpga_path():
     """Gets the FPGA path based on its PCI BDF."""
     fpga_bdf = get_pci_bdf_info(IOB_DEV_ID)
@@ -254,14 +279,9 @@ class Fboss:
 
     def _show_iob_dev_info(self) -> str:
         """Gets and formats IOB device information."""
-        path_file = f"{IOB_PCI_DRIVER}.fpga_info_iob.0/device_id"
-        iob_device_id = read_sysfile_value(f"{DEV_PATH}{path_file}")
-        path_file = f"{IOB_PCI_DRIVER}.fpga_info_iob.0/fpga_ver"
-        iob_version = read_sysfile_value(f"{DEV_PATH}{path_file}")
-        path_file = f"{IOB_PCI_DRIVER}.fpga_info_iob.0/board_id"
-        iob_board_id = read_sysfile_value(f"{DEV_PATH}{path_file}")
-        path_file = f"{IOB_PCI_DRIVER}.fpga_info_iob.0/board_rev"
-        iob_board_rev = read_sysfile_value(f"{DEV_PATH}{path_file}")
+        iob_device_id, iob_version, iob_board_id, iob_board_rev = _read_fpga_info(
+            "fpga_info_iob.0"
+        )
         uptime_val = self.iob_up_time_test()
         iob_uptime = timedelta(seconds=int(uptime_val, 16))
 
@@ -274,14 +294,9 @@ IOB Uptime         : {iob_uptime}
 """
 
     def _show_dom1_dev_info(self) -> str:
-        path_file = f"{IOB_PCI_DRIVER}.fpga_info_dom.1/device_id"
-        dom1_device_id = read_sysfile_value(f"{DEV_PATH}{path_file}")
-        path_file = f"{IOB_PCI_DRIVER}.fpga_info_dom.1/fpga_ver"
-        dom1_version = read_sysfile_value(f"{DEV_PATH}{path_file}")
-        path_file = f"{IOB_PCI_DRIVER}.fpga_info_dom.1/board_id"
-        dom1_board_id = read_sysfile_value(f"{DEV_PATH}{path_file}")
-        path_file = f"{IOB_PCI_DRIVER}.fpga_info_dom.1/board_rev"
-        dom1_board_rev = read_sysfile_value(f"{DEV_PATH}{path_file}")
+        dom1_device_id, dom1_version, dom1_board_id, dom1_board_rev = _read_fpga_info(
+            "fpga_info_dom.1"
+        )
 
         return f"""\
 DOM1 Device ID     : {dom1_device_id}
@@ -291,14 +306,9 @@ DOM1 Board Revision: {dom1_board_rev}
 """
 
     def _show_dom2_dev_info(self) -> str:
-        path_file = f"{IOB_PCI_DRIVER}.fpga_info_dom.2/device_id"
-        dom2_device_id = read_sysfile_value(f"{DEV_PATH}{path_file}")
-        path_file = f"{IOB_PCI_DRIVER}.fpga_info_dom.2/fpga_ver"
-        dom2_version = read_sysfile_value(f"{DEV_PATH}{path_file}")
-        path_file = f"{IOB_PCI_DRIVER}.fpga_info_dom.2/board_id"
-        dom2_board_id = read_sysfile_value(f"{DEV_PATH}{path_file}")
-        path_file = f"{IOB_PCI_DRIVER}.fpga_info_dom.2/board_rev"
-        dom2_board_rev = read_sysfile_value(f"{DEV_PATH}{path_file}")
+        dom2_device_id, dom2_version, dom2_board_id, dom2_board_rev = _read_fpga_info(
+            "fpga_info_dom.2"
+        )
 
         return f"""\
 DOM2 Device ID     : {dom2_device_id}
@@ -345,12 +355,12 @@ System Uptime   : {execute_shell_cmd('uptime -p')[1].strip()}
         if not _:
             return bsp_version
 
-        bsp_version = re.findall(r"BSP_VER\S+", bsp_info, re.M)
-        if not bsp_version:
+        bsp_match = BSP_VER_PATTERN.search(bsp_info)
+        if not bsp_match:
             return None
 
-        version_str = bsp_version[0].split("=")[1]
-        return re.sub('["v]', "", version_str)
+        version_str = bsp_match.group(0).split("=")[1]
+        return BSP_VER_STRIP_PATTERN.sub("", version_str)
 
     def _cplds_version(self, dev_info, dev_addr) -> str:
         # Get CPLD Version
@@ -367,6 +377,15 @@ System Uptime   : {execute_shell_cmd('uptime -p')[1].strip()}
 
         return cpld_version[0], cpld_version[1], cpld_version[2]
 
+    def _cplds_version_str(self, cplds) -> list:
+        """Reads the (bus, addr) CPLDs concurrently and formats their versions."""
+        with ThreadPoolExecutor(max_workers=len(cplds)) as executor:
+            versions = list(executor.map(lambda cpld: self._cplds_version(*cpld), cplds))
+        return [
+            f"{_major[0] & 0x7f}.{_minor[0]}.{_patch[0]}"
+            for _major, _minor, _patch in versions
+        ]
+
     def firmware_version_info(self) -> str:
         """get firmware version functon"""
         # IOB/DOM FPGA Version
@@ -391,23 +410,12 @@ System Uptime   : {execute_shell_cmd('uptime -p')[1].strip()}
                 dom2_version = "NA"
             else:
                 dom2_version = f"0.{int(val, 16)}"
-            # SCM CPLD version
-            _major, _minor, _patch = self._cplds_version(
-                I2C_BUS_SCMCPLD, I2C_ADDR_SCMCPLD
-            )
-            scm_version = f"{_major[0] & 0x7f}.{_minor[0]}.{_patch[0]}"
-
-            # SMB CPLD version
-            _major, _minor, _patch = self._cplds_version(
-                I2C_BUS_SMBCPLD, I2C_ADDR_SMBCPLD
-            )
-            smb_version = f"{_major[0] & 0x7f}.{_minor[0]}.{_patch[0]}"
-
-            # MCB CPLD version
-            _major, _minor, _patch = self._cplds_version(
-                I2C_BUS_MCBCPLD, I2C_ADDR_MCBCPLD
-            )
-            mcb_version = f"{_major[0] & 0x7f}.{_minor[0]}.{_patch[0]}"
+            # SCM/SMB/MCB CPLD versions
+            scm_version, smb_version, mcb_version = self._cplds_version_str((
+                (I2C_BUS_SCMCPLD, I2C_ADDR_SCMCPLD),
+                (I2C_BUS_SMBCPLD, I2C_ADDR_SMBCPLD),
+                (I2C_BUS_MCBCPLD, I2C_ADDR_MCBCPLD),
+            ))
             return f"""\
 [Firmware Version Info]
 {self._platform.title()} BIOS      : {self._bios_version()}
@@ -421,23 +429,12 @@ System Uptime   : {execute_shell_cmd('uptime -p')[1].strip()}
 {self._platform.title()} MCB CPLD  : {mcb_version}
 """
         if self._platform == "janga" or self._platform == "tahan":
-            # PWR CPLD Version
-            _major, _minor, _patch = self._cplds_version(
-                I2C_BUS_PWRCPLD, I2C_ADDR_PWRCPLD
-            )
-            pwr_version = f"{_major[0] & 0x7f}.{_minor[0]}.{_patch[0]}"
-
-            # SMB CPLD1 Version
-            _major, _minor, _patch = self._cplds_version(
-                I2C_BUS_SMBCPLD1, I2C_ADDR_SMBCPLD1
-            )
-            smb1_version = f"{_major[0] & 0x7f}.{_minor[0]}.{_patch[0]}"
-
-            # SMB CPLD2 Version
-            _major, _minor, _patch = self._cplds_version(
-                I2C_BUS_SMBCPLD2, I2C_ADDR_SMBCPLD2
-            )
-            smb2_version = f"{_major[0] & 0x7f}.{_minor[0]}.{_patch[0]}"
+            # PWR/SMB1/SMB2 CPLD versions
+            pwr_version, smb1_version, smb2_version = self._cplds_version_str((
+                (I2C_BUS_PWRCPLD, I2C_ADDR_PWRCPLD),
+                (I2C_BUS_SMBCPLD1, I2C_ADDR_SMBCPLD1),
+                (I2C_BUS_SMBCPLD2, I2C_ADDR_SMBCPLD2),
+            ))
 
             return f"""\
 [Firmware Version Info]
@@ -1,8 +1,10 @@
 import subprocess
-import pathlib
 import os
+import re
+import shlex
 import sys
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Dict, Iterator, Tuple, Optional
 
 # Constants for clarity
 MSG_FILE_NOT_FOUND = "\u001b[31mFAIL\u001b[0m\t{}File not exist."
@@ -27,89 +29,152 @@ COLOR_MAP = {
     "cyan": COLOR_CYAN,
 }
 
+# Color-wrapped "{}" templates, built once instead of concatenated per line
+_COLOR_FMT = {name: f"{code}{{}}{COLOR_RESET}" for name, code in COLOR_MAP.items()}
+
+# print_dict (nested key, leaf key) templates, keyed by the `colors` flag
+_PRINT_DICT_FMT = {
+    True: (_COLOR_FMT["cyan"], _COLOR_FMT["yellow"] + " :"),
+    False: ("{}:", "{}:"),
+}
+
+# Indent prefixes for print_dict; deeper levels fall back to '\t' * level
+_TABS = tuple('\t' * level for level in range(32))
+
+# `lspci -n` line: "<bdf> <class>: <vendor>:<device> ..."
+LSPCI_DEV_PATTERN = re.compile(rb"^(\S+)\s+\S+:\s*([0-9a-f]{4}):([0-9a-f]{4})", re.M)
+
+# Parsed `lspci -n` table, loaded on first lookup: {"vendor:device": bdf, "vendor": bdf}
+_PCI_CACHE: Optional[Dict[str, str]] = None
+
+
+def _fmt_dict(dictionary: dict, indent: int = 0, colors: bool = False) -> Iterator[str]:
+    """Yields the lines print_dict shows for a (possibly nested) dictionary."""
+    dict_fmt, value_fmt = _PRINT_DICT_FMT[bool(colors)]
+    # Walk nested dicts with an explicit stack of (items iterator, indent level)
+    stack = [(iter(dictionary.items()), indent)]
+    while stack:
+        items, level = stack[-1]
+        tabs = _TABS[level] if level < len(_TABS) else '\t' * level
+        for key, value in items:
+            if isinstance(value, dict):
+                yield f"{tabs} {dict_fmt.format(key)}"
+                stack.append((iter(value.items()), level + 1))
+                break
+            yield f"{tabs} {value_fmt.format(key)} {value}"
+        else:
+            stack.pop()
+
+
 def print_dict(dictionary: dict, previous: str = '', indent: int = 0, colors: bool = False) -> None:
     """
     Prints a dictionary in a visually appealing format.
 
     Args:
         dictionary: The dictionary to print.
-        previous: The key of the parent dictionary (used for recursion).
+        previous: The key of the parent dictionary (unused, kept for compatibility).
         indent: The indentation level for the current level.
         colors: Whether to use color codes in the output.
     """
-    for key, value in dictionary.items():
-        if isinstance(value, dict):
-            if colors:
-                print('\t' * indent, COLOR_MAP.get("cyan", COLOR_CYAN) + str(key) + COLOR_RESET)
-            else:
-                print('\t' * indent, str(key) + ':')
-            print_dict(value, previous=key, indent=indent + 1, colors=colors)
-        else:
-            if colors:
-                print('\t' * indent, COLOR_MAP.get("yellow", COLOR_YELLOW) + str(key) + COLOR_RESET, ":", value)
-            else:
-                print('\t' * indent, str(key) + ':', value)
+    lines = list(_fmt_dict(dictionary, indent=indent, colors=colors))
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+@lru_cache(maxsize=128)
+def _tokenize_cmd(cmd: str) -> Tuple[str, ...]:
+    """Splits a command line into argv, cached per unique command string."""
+    return tuple(shlex.split(cmd))
 
 
 def execute_shell_cmd(cmd: str) -> Tuple[bool, str]:
     """Executes a shell command and returns the status and output."""
     try:
         result = subprocess.run(
-            cmd.split(), stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False
+            _tokenize_cmd(cmd), capture_output=True, text=True, check=False
         )
         if result.returncode == 0:
-            return True, result.stdout.decode().strip()
+            return True, result.stdout.strip()
         else:
             return False, (
-                result.stdout.decode().strip()
+                result.stdout.strip()
                 + f"\n- Error Code: {result.returncode}\n- Error:\n"
-                + result.stderr.decode().strip()
+                + result.stderr.strip()
             )
     except FileNotFoundError as fne:
         return False, fne.strerror + f": {cmd}"
 
 
+def _run_bytes(cmd: str) -> Optional[bytes]:
+    """Runs a command and returns its raw stdout, or None on failure."""
+    try:
+        result = subprocess.run(
+            _tokenize_cmd(cmd), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False
+        )
+    except FileNotFoundError:
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def _load_pci_cache() -> Optional[Dict[str, str]]:
+    """Runs `lspci -n` once and maps each vendor and vendor:device ID to its BDF."""
+    pci_cache = {}
+    stdout = _run_bytes("lspci -n")
+    if stdout is None:
+        return None
+    # Only the ASCII BDF and ID fields are decoded, not the whole output
+    for match in LSPCI_DEV_PATTERN.finditer(stdout):
+        bdf, vendor, device = (field.decode() for field in match.groups())
+        # Keep the first match, same as the original linear scan
+        pci_cache.setdefault(f"{vendor}:{device}", bdf)
+        pci_cache.setdefault(vendor, bdf)
+    return pci_cache
+
+
 def get_pci_bdf_info(vendor_id: str) -> Optional[str]:
     """Retrieves the PCI Bus, Device, and Function (BDF) information for a device with the given vendor ID."""
-    status, stdout = execute_shell_cmd("lspci -n")
-    if not status:
-        return None
-    for line in stdout.splitlines():
-        if vendor_id in line:
-            return line.split()[0]
-    return None
+    global _PCI_CACHE
+    if _PCI_CACHE is None:
+        _PCI_CACHE = _load_pci_cache()
+        if _PCI_CACHE is None:
+            return None
+    return _PCI_CACHE.get(vendor_id)
 
 
 def read_sysfile_value(devfile: str) -> Optional[str]:
     """Reads the value from a sysfs file."""
-    if pathlib.Path(devfile).exists():
-        try:
-            with open(devfile, "r", encoding="utf-8") as devfd:
-                return devfd.read().strip()
-        except IOError:
-            print(f"FAIL\tcannot open {devfile}")
-        except Exception as err:
-            print(f"FAIL\tUnexpected {err=}, {type(err)=}")
-            raise
-    else:
+    try:
+        with open(devfile, "r", encoding="utf-8") as devfd:
+            return devfd.read().strip()
+    except FileNotFoundError:
         print(MSG_FILE_NOT_FOUND.format(devfile))
+    except IOError:
+        print(f"FAIL\tcannot open {devfile}")
+    except Exception as err:
+        print(f"FAIL\tUnexpected {err=}, {type(err)=}")
+        raise
     return None
 
 
 def write_sysfile_value(devfile: str, val: str) -> Tuple[bool, str]:
     """Writes a value to a sysfs file."""
-    if pathlib.Path(devfile).exists():
+    try:
+        # sysfs attributes already exist: no O_CREAT, and one write() per value
+        devfd = os.open(devfile, os.O_WRONLY)
         try:
-            with open(devfile, "w", encoding="utf-8") as devfd:
-                devfd.write(str(val))
-            return True, "PASS"
-        except IOError:
-            return False, f"FAIL\tcannot open {devfile}"
-        except Exception as err:
-            print(f"FAIL\tUnexpected {err=}, {type(err)=}")
-            raise
-    else:
+            os.write(devfd, str(val).encode())
+        finally:
+            os.close(devfd)
+        return True, "PASS"
+    except FileNotFoundError:
         return False, MSG_FILE_NOT_FOUND.format(devfile)
+    except IOError:
+        return False, f"FAIL\tcannot open {devfile}"
+    except Exception as err:
+        print(f"FAIL\tUnexpected {err=}, {type(err)=}")
+        raise
 
 def get_platform():
     """
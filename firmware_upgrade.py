@@ -1,10 +1,19 @@
 import os
+import re
+import sys
+import codecs
+import hashlib
 import time
 import pathlib
-from fboss_utils import execute_shell_cmd
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from types import MappingProxyType
+from typing import List, Optional, Tuple
 
 # Chip and GPIO pin mappings
-CHIP_MAP = {
+CHIP_MAP = MappingProxyType({
     "iob": "N25Q128..3E",
     "dom1": "N25Q128..3E",
     "dom2": "N25Q128..3E",
@@ -14,9 +23,9 @@ CHIP_MAP = {
     "pwrcpld": "W25X20",
     "smbcpld1": "W25X20",
     "smbcpld2": "W25X20",
-}
+})
 
-GPIOPIN_MAP = {
+GPIOPIN_MAP = MappingProxyType({
     "dom1": "9",
     "dom2": "10",
     "mcbcpld": "3",
@@ -25,32 +34,163 @@ GPIOPIN_MAP = {
     "pwrcpld": "3",
     "smbcpld1": "1",
     "smbcpld2": "7",
-}
+})
 
-def select_gpio(gpio_pin: str) -> None:
+# Component names for display and for O(1) membership checks
+DEVICES_LIST = tuple(CHIP_MAP)
+DEVICES_SET = frozenset(CHIP_MAP)
+
+# Percentage reported by flashrom while erasing/writing/verifying
+FLASHROM_PROGRESS_PATTERN = re.compile(r"[ \t]*(\d{1,3})%")
+FLASHROM_TRAILING_DIGITS_PATTERN = re.compile(r"\d{0,3}$")
+
+def _set_gpio(gpio_pin: str, value: int) -> bool:
+    """Drives a gpiochip0 pin; a missing gpioset counts as a failed call."""
+    try:
+        result = subprocess.run(["gpioset", "gpiochip0", f"{gpio_pin}={value}"], check=False)
+    except OSError as err:
+        print(f"\nError: Cannot run gpioset: {err}\n")
+        return False
+    return result.returncode == 0
+
+def select_gpio(gpio_pin: str) -> bool:
     """Selects the specified GPIO pin."""
-    gpiocmd = f"gpioset gpiochip0 {gpio_pin}=1"
-    os.system(gpiocmd)
+    return _set_gpio(gpio_pin, 1)
 
-def release_gpio(gpio_pin: str) -> None:
+def release_gpio(gpio_pin: str) -> bool:
     """Releases the specified GPIO pin."""
-    gpiocmd = f"gpioset gpiochip0 {gpio_pin}=0"
-    os.system(gpiocmd)
+    return _set_gpio(gpio_pin, 0)
+
+class ProgressBar:
+    """Text progress bar, redrawn only when the caller reports real progress."""
+
+    def __init__(self, total: int, prefix: str = "Progress:", suffix: str = "Complete",
+                 decimals: int = 1, length: int = 50, fill: str = "#"):
+        self.total = total
+        self.length = length
+        # Full-width fill/empty lines are sliced per update instead of rebuilt
+        self._fill_line = fill * length
+        self._empty_line = "-" * length
+        self._line_fmt = f"\r{prefix} |{{}}| {{:.{decimals}f}}% {suffix}\r"
 
-# Removed progress_bar function
+    def update(self, done: int) -> None:
+        """Redraws the bar for `done` out of `total` steps."""
+        filled_length = self.length * done // self.total
+        bar = self._fill_line[:filled_length] + self._empty_line[filled_length:]
+        sys.stdout.write(self._line_fmt.format(bar, 100 * done / self.total))
+        if done >= self.total:
+            sys.stdout.write("\n")
+        sys.stdout.flush()
+
+class _FlashromConsole:
+    """Interleaves echoed flashrom text with the progress bar on the terminal."""
+
+    def __init__(self):
+        self._bar = ProgressBar(100)
+        self._bar_on_line = False  # cursor sits at the start of a partially drawn bar
+        self._mid_line = False  # echoed text left the cursor mid-line
+        self._bar_ended_line = False  # a finished bar already wrote its newline
+
+    def echo(self, text: str) -> None:
+        """Writes flashrom text below the bar instead of over it."""
+        if text and self._bar_ended_line:
+            self._bar_ended_line = False
+            if text.startswith("\n"):
+                text = text[1:]
+        if not text or (self._bar_on_line and text.isspace()):
+            return
+        if self._bar_on_line:
+            sys.stdout.write("\n")
+            self._bar_on_line = False
+        sys.stdout.write(text)
+        self._mid_line = not text.endswith(("\n", "\r"))
+
+    def progress(self, done: int) -> None:
+        """Draws the bar on a line of its own."""
+        if self._mid_line:
+            sys.stdout.write("\n")
+            self._mid_line = False
+        self._bar.update(done)
+        self._bar_on_line = done < 100
+        self._bar_ended_line = not self._bar_on_line
+
+    def finish(self) -> None:
+        """Leaves the cursor on a fresh line."""
+        if self._bar_on_line or self._mid_line:
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+
+@lru_cache(maxsize=1)
+def flashrom_has_progress() -> bool:
+    """Checks once whether the installed flashrom accepts --progress."""
+    try:
+        result = subprocess.run(
+            ["flashrom", "--help"], capture_output=True, text=True, check=False
+        )
+    except OSError:
+        return False
+    return "--progress" in result.stdout + result.stderr
+
+def run_flashrom(flashrom_cmd: List[str]) -> int:
+    """Runs flashrom, streaming its output and driving a progress bar from it.
+
+    Output is read unbuffered, so the bar follows each percentage as it is
+    reported; the rest of the text is echoed with the percentages cut out.
+    Raises OSError if flashrom cannot be started.
+    """
+    console = _FlashromConsole()
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    with subprocess.Popen(
+        flashrom_cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=0
+    ) as proc:
+        fd = proc.stdout.fileno()
+        while True:
+            # Raw reads return as soon as flashrom writes, newline or not
+            chunk = os.read(fd, 4096)
+            text = pending + decoder.decode(chunk, final=not chunk)
+            pending = ""
+            if chunk:
+                # Trailing digits may be a percentage split across two reads
+                split = FLASHROM_TRAILING_DIGITS_PATTERN.search(text).start()
+                text, pending = text[:split], text[split:]
+            # Handle text and percentages in the order flashrom reported them
+            pos = 0
+            for match in FLASHROM_PROGRESS_PATTERN.finditer(text):
+                console.echo(text[pos:match.start()])
+                console.progress(min(int(match.group(1)), 100))
+                pos = match.end()
+            console.echo(text[pos:])
+            sys.stdout.flush()
+            if not chunk:
+                break
+    console.finish()
+    return proc.returncode
 
 def get_firmware_image_md5(fwimg: str) -> str:
     """Calculates and returns the MD5 checksum of the firmware image."""
-    status, stdout = execute_shell_cmd(f"md5sum {fwimg}")
-    if not status:
-        print("Not support md5sum utilty.")
+    try:
+        with open(fwimg, "rb") as f:
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "md5").hexdigest()
+            # Python < 3.11: hash in 1 MiB chunks into a reused buffer
+            md5 = hashlib.md5()
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            while True:
+                size = f.readinto(buf)
+                if not size:
+                    break
+                md5.update(view[:size])
+            return md5.hexdigest()
+    except OSError as err:
+        print(f"Cannot read firmware image: {err}")
         return ""
-    for line in stdout.splitlines():
-        return line.split()[0]
 
-def verify_firmware_md5(fwimg: str) -> bool:
+def verify_firmware_md5(fwimg: str, img_md5: Optional[str] = None) -> bool:
     """Verifies the MD5 checksum of the firmware image against a .md5 file."""
-    img_md5 = get_firmware_image_md5(fwimg)
+    if img_md5 is None:
+        img_md5 = get_firmware_image_md5(fwimg)
     fwimg_folder = os.path.dirname(fwimg)  # Get the folder path
     md5_file = os.path.join(fwimg_folder, os.path.basename(fwimg) + ".md5")  # Construct the MD5 file path
     if pathlib.Path(md5_file).exists():
@@ -61,65 +201,136 @@ def verify_firmware_md5(fwimg: str) -> bool:
             return False
     return True
 
-def firmware_upgrade() -> None:
-    """Prompts the user for component and firmware file, then performs the upgrade."""
-    devices_list = list(CHIP_MAP.keys())
-    print(f"Components list: {devices_list}")
-    devname = None
-    for i in range(3):
-        devname = input("Component Name: ")
-        if devname in devices_list:
-            break
+def build_upgrade_cmd(devname: str, fwimg: str) -> List[str]:
+    """Builds the flashrom argv that writes fwimg to the given component."""
+    flash_devmap = f"/run/devmap/flashes/{devname.upper()}_FLASH"
+    if devname == "scmcpld":
+        flash_devmap = f"/run/devmap/flashes/I210_{devname.upper()}_FLASH"
+    upgrade_cmd = [
+        "flashrom", "-p", f"linux_spi:dev={os.readlink(flash_devmap)}",
+        "-w", fwimg, "-c", CHIP_MAP[devname],
+    ]
+    # Older flashrom builds reject --progress and only print plain status lines
+    if flashrom_has_progress():
+        upgrade_cmd.append("--progress")
+    return upgrade_cmd
+
+def firmware_upgrade_many(jobs: List[Tuple[str, str]]) -> List[bool]:
+    """Upgrades (component, firmware file) pairs without prompting.
+
+    Jobs sharing a mux GPIO pin are flashed back to back, so each pin is
+    selected and released once. Returns one upgrade result per job, in
+    input order.
+    """
+    results = [False] * len(jobs)
+    valid_jobs = []
+    for idx, (devname, fwimg) in enumerate(jobs):
+        if devname not in DEVICES_SET or not os.path.exists(fwimg):
+            print(f"\nError: Invalid component or firmware file: {devname} {fwimg}\n")
+            continue
+        valid_jobs.append(idx)
+
+    # Hash all images up front, overlapping the reads
+    with ThreadPoolExecutor() as executor:
+        md5_list = list(executor.map(get_firmware_image_md5, [jobs[idx][1] for idx in valid_jobs]))
+
+    def gpio_key(item):
+        return GPIOPIN_MAP.get(jobs[item[0]][0], "")
+
+    ordered_jobs = sorted(zip(valid_jobs, md5_list), key=gpio_key)
+    for gpionum, group in groupby(ordered_jobs, key=gpio_key):
+        if gpionum and not select_gpio(gpionum):
+            # Never flash an unselected mux; every job in the group stays False
+            devnames = ", ".join(jobs[idx][0] for idx, _ in group)
+            print(f"\nError: Cannot select GPIO {gpionum}, skipping: {devnames}\n")
+            continue
+        try:
+            for idx, img_md5 in group:
+                devname, fwimg = jobs[idx]
+                if not verify_firmware_md5(fwimg, img_md5):
+                    continue
+                print(f"\n{devname} Firmware Image MD5:", img_md5, "\n")
+                try:
+                    upgrade_cmd = build_upgrade_cmd(devname, fwimg)
+                    print(" ".join(upgrade_cmd), "\n\nStarting firmware upgrade...\n")
+                    results[idx] = run_flashrom(upgrade_cmd) == 0
+                except OSError as err:
+                    print(f"\nError: {devname} firmware upgrade failed: {err}\n")
+                    continue
+                if not results[idx]:
+                    print(f"\nError: {devname} firmware upgrade failed!\n")
+        finally:
+            # Never leave the mux selected, even if a job blew up
+            if gpionum:
+                release_gpio(gpionum)
+
+    return results
+
+def firmware_upgrade(devname: Optional[str] = None, fwimg: Optional[str] = None) -> None:
+    """Performs the upgrade, prompting for component and firmware file unless given."""
+    devices_list = list(DEVICES_LIST)
+    if devname is None:
+        print(f"Components list: {devices_list}")
+        for i in range(3):
+            devname = input("Component Name: ")
+            if devname in DEVICES_SET:
+                break
+            else:
+                print(
+                    f"Invalid Component, try again.\nComponents list: {devices_list}"
+                )
         else:
-            print(
-                f"Invalid Component, try again.\nComponents list: {devices_list}"
-            )
-    else:
-        print("\nError: Input component over 3 times!\n")
+            print("\nError: Input component over 3 times!\n")
+            return
+    elif devname not in DEVICES_SET:
+        print(f"\nError: Invalid component {devname}!\nComponents list: {devices_list}\n")
         return
 
-    chipname = CHIP_MAP.get(devname)
     gpionum = GPIOPIN_MAP.get(devname)
-    fwimg = input("Firmware Upgrade file path: ")
+    if fwimg is None:
+        fwimg = input("Firmware Upgrade file path: ")
     if not fwimg or not pathlib.Path(fwimg).exists():
         print("\nError: Firmware file not exist!\n")
         return
 
-    # Verify MD5 checksum
-    if not verify_firmware_md5(fwimg):
+    # Verify MD5 checksum, hashing the image only once
+    img_md5 = get_firmware_image_md5(fwimg)
+    if not verify_firmware_md5(fwimg, img_md5):
         if input("Continue upgrade despite MD5 mismatch? (y/n): ").lower() != 'y':
             return
 
     # Show image MD5
-    img_md5 = get_firmware_image_md5(fwimg)
     print("\nFirmware Image MD5:", img_md5, "\n")
 
-    # Switch mux to select flash device and upgrade
-    if gpionum:
-        select_gpio(gpionum)
-
-    flash_devmap = f"/run/devmap/flashes/{devname.upper()}_FLASH"
-    if devname == "scmcpld":
-        flash_devmap = f"/run/devmap/flashes/I210_{devname.upper()}_FLASH"
-    upgrade_cmd = f"flashrom -p linux_spi:dev={os.readlink(flash_devmap)} -w {fwimg} -c {chipname}"
-    print(upgrade_cmd, "\n\nStarting firmware upgrade...\n")
+    # Switch mux to select flash device and upgrade; never flash an unselected mux
+    if gpionum and not select_gpio(gpionum):
+        print(f"\nError: Cannot select GPIO {gpionum} for {devname}, upgrade aborted!\n")
+        return
 
-    os.system(upgrade_cmd)
+    try:
+        upgrade_cmd = build_upgrade_cmd(devname, fwimg)
+        print(" ".join(upgrade_cmd), "\n\nStarting firmware upgrade...\n")
 
-    # Release GPIO pin
-    if gpionum:
-        release_gpio(gpionum)
+        if run_flashrom(upgrade_cmd) != 0:
+            print("\nError: Firmware upgrade failed!\n")
+    except OSError as err:
+        print(f"\nError: Firmware upgrade failed: {err}\n")
+    finally:
+        # Release GPIO pin
+        if gpionum:
+            release_gpio(gpionum)
 
-def fboss_firmware_test():
+def fboss_firmware_test(devname: Optional[str] = None, fwimg: Optional[str] = None):
     print(
         "-------------------------------------------------------------------------\n"
         "                       |  Firmware Upgrade test  |\n"
         "-------------------------------------------------------------------------\n"
     )
-    firmware_upgrade()
+    firmware_upgrade(devname, fwimg)
     print(
         "\n-------------------------------------------------------------------------\n"
     )
 
 if __name__ == "__main__":
-    fboss_firmware_test()
+    # Optional: firmware_upgrade.py [component] [firmware file]
+    fboss_firmware_test(*sys.argv[1:3])
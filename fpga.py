@@ -6,24 +6,24 @@ import mmap
 import random
 from typing import Tuple
 import struct
+from functools import lru_cache
 
-from fboss_utils import execute_shell_cmd
+from fboss_utils import get_pci_bdf_info
 import i2cbus
 
 OFFSET_REVISION = 0x00000
 OFFSET_REVISION_DOM1 = 0x40000
 
-IOB_RESOURCE0 = ""
+IOB_DEV_ID = "1d9b:0011"
 
+@lru_cache(maxsize=1)
 def _fetch_resourse0() -> str:
-    status, stdout = execute_shell_cmd("lspci -nd 1d9b:0011")
-    if not status:
-        return None
-    pcie_bdf = stdout.split()[0]
+    # Resolved once, on first register access rather than at import
+    pcie_bdf = get_pci_bdf_info(IOB_DEV_ID)
+    if pcie_bdf is None:
+        raise FileNotFoundError(f"IOB {IOB_DEV_ID} not found")
     return f"/sys/bus/pci/devices/0000:{pcie_bdf}/resource0"
 
-IOB_RESOURCE0 = _fetch_resourse0()
-
 def load_yaml_file() :
     yaml_file_name = "MP3_FPGA.yaml"
 
@@ -33,7 +33,7 @@ def load_yaml_file() :
     return data
 
 def _iob_read(offset: int, length: int)  -> bytes:
-    with open(IOB_RESOURCE0, "r+b") as fpga_fd, mmap.mmap(
+    with open(_fetch_resourse0(), "r+b") as fpga_fd, mmap.mmap(
         fpga_fd.fileno(), 0
     ) as mm_fpga:
         mm_fpga.seek(offset)
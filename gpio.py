@@ -9,6 +9,8 @@ import i2cbus
 
 IOB_PCI_DRIVER = "fbiob_pci"
 GPIO_CHIP_NAME = "IOB_GPIO_CHIP_0"
+# gpiodetect line of the IOB GPIO chip; group 1 is the chip name before "["
+GPIO_DEV_PATTERN = re.compile(rf"^([^\[\n]*)\[.*{IOB_PCI_DRIVER}.gpiochip.0", re.M)
 
 GPIO_SUCCESS = "success"
 GPIO_ERR_1 = "No fbiob GPIO device"
@@ -33,17 +35,13 @@ def detect_gpio_devmap_device() -> str:
 def get_gpiochipnumber() -> Tuple[bool, str]:
     """Get gpio pin number."""
     cmd = "gpiodetect"
-    gpio_dev = f"{IOB_PCI_DRIVER}.gpiochip.0"
-    pattern = re.compile(gpio_dev)
     stat, value = execute_shell_cmd(cmd)
     if not stat:
         return stat, GPIO_ERR_1
 
-    for line in value.splitlines():
-        result = pattern.findall(line)
-        if result:
-            gpiochip = line.split("[")[0]
-            return stat, gpiochip
+    match = GPIO_DEV_PATTERN.search(value)
+    if match:
+        return stat, match.group(1)
 
     return False, GPIO_ERR_1
 
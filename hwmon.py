@@ -1,4 +1,5 @@
 import os
+import sys
 
 from fboss_utils import print_dict
 
@@ -121,32 +122,36 @@ class Hwmon():
         """Prints sensor data in a tabular format."""
         ret = "\033[1;32mPASS\033[00m"
         TABLE_FLAG = "-----------+"
+        border = "+--------" + TABLE_FLAG * 7
+        empty_cell = "| " + "-".center(10)
         dictionary = self.data()
-        print("+--------" + TABLE_FLAG * 7)
+        # Build the whole table and write it once instead of one print per cell
+        lines = [border]
         if isinstance(dictionary, dict):
             for key in sorted(dictionary.keys()):
-                indent = 1
                 status = "\033[1;32mPASS\033[00m"
-                print("|" + f"{key:^19}", end="")
-                print("|   Value   | Max Value | Min Value | Crit Max  | Crit Min  |  Status   |")
-                print("+--------" + TABLE_FLAG * 7)
-                
+                lines.append(
+                    f"|{key:^19}"
+                    "|   Value   | Max Value | Min Value | Crit Max  | Crit Min  |  Status   |"
+                )
+                lines.append(border)
+
                 if isinstance(dictionary[key], dict):
                     for key_list in sorted(dictionary[key].keys()):
-                        print("|", f"{key_list:^18}", end="")
-                        for n in range(5):
-                            if dictionary[key][key_list][n]:
-                                print("|", f"{dictionary[key][key_list][n]:^10}", end="")
-                            else:
-                                print("|", "-".center(10), end="")
-
-                        if not self.compare_element(dictionary[key][key_list]):
+                        values = dictionary[key][key_list]
+                        cells = "".join(
+                            f"| {values[n]:^10}" if values[n] else empty_cell
+                            for n in range(5)
+                        )
+
+                        if not self.compare_element(values):
                             status = "\033[1;31mFAIL\033[0m"
                             ret = "\033[1;31mFAIL\033[0m"
 
-                        print("|   ", status, "  |")
+                        lines.append(f"| {key_list:^18}{cells}|    {status}   |")
 
-                    print("+--------" + TABLE_FLAG * 7)
+                    lines.append(border)
+        sys.stdout.write("\n".join(lines) + "\n")
         return ret
     
     def hwmon_test(self):
@@ -50,6 +50,8 @@ def check_drv_udev_status() -> Tuple[bool, str]:
         return False, f"{FAIL_COLOR} FAIL{END_COLOR}\tNo I2C bus, i2c driver error."
 
     devs_list = parse_sort_drv_devices(i2c_dev_list)
+    # Map i2c-N back to its udev name once, instead of rescanning devmap per adapter
+    udev_by_bus = {devid: dev for dev, devid in parse_dev_udev().items()}
     status = "PASS"
 
     for i2cdev in devs_list:
@@ -68,10 +70,7 @@ def check_drv_udev_status() -> Tuple[bool, str]:
             else:
                 continue
 
-            devs_dict = parse_dev_udev()
-            for item in devs_dict.items():
-                if item[1] == i2cinfo:
-                    udev_info = item[0]
+            udev_info = udev_by_bus.get(i2cinfo, udev_info)
             print(
                 f'  {masterid:<5}{"":2}{i2cinfo:<6}{"":3}{adapter_info:<30}'
                 + f'{"":3}{udev_info:15} {status:<5}  \n',
@@ -1,6 +1,4 @@
-import pathlib
-import subprocess
-from typing import Tuple, Optional
+from fboss_utils import execute_shell_cmd, read_sysfile_value
 
 PASS = "\033[1;32mPASS\033[00m"
 FAILED = "\033[1;31mFAIL\033[0m"
@@ -16,49 +14,11 @@ IOB_BDF = "17:00.0"
 
 PCI_PATH = "/sys/bus/pci/devices/0000:{}"
 
-MSG_FILE_NOT_FOUND = "\u001b[31mFAIL\u001b[0m\t{}File not exist."
-
 # Error handling and logging
 # import logging
 # logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 
-def execute_shell_cmd(cmd: str) -> Tuple[bool, str]:
-    """Executes a shell command and returns the status and output."""
-    try:
-        result = subprocess.run(
-            cmd.split(), stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False
-        )
-        if result.returncode == 0:
-            return True, result.stdout.decode().strip()
-        else:
-            # logging.error(f"Command '{cmd}' failed with error code {result.returncode}")
-            return False, (
-                result.stdout.decode().strip()
-                + f"\n- Error Code: {result.returncode}\n- Error:\n"
-                + result.stderr.decode().strip()
-            )
-    except FileNotFoundError as fne:
-        # logging.error(f"Command '{cmd}' failed: {fne.strerror}")
-        return False, fne.strerror + f": {cmd}"
-
-
-def read_sysfile_value(devfile: str) -> Optional[str]:
-    """Reads the value from a sysfs file."""
-    if pathlib.Path(devfile).exists():
-        try:
-            with open(devfile, "r", encoding="utf-8") as devfd:
-                return devfd.read().strip()
-        except IOError:
-            print(f"FAIL\tcannot open {devfile}")
-        except Exception as err:
-            print(f"FAIL\tUnexpected {err=}, {type(err)=}")
-            raise
-    else:
-        print(MSG_FILE_NOT_FOUND.format(devfile))
-    return None
-
-
 def store_config():
     cmd = f"lspci -s {IOB_BDF} -xxx"
     status, stdout = execute_shell_cmd(cmd)
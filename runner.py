@@ -5,13 +5,6 @@ import argparse
 import os
 import sys
 from fboss import Fboss
-from xadc import test_iob_xadc
-from xcvr import XcvrManager
-from leds import port_led_status_test, port_led_loop_test
-from hwmon import Hwmon
-from sensor import sensor_test
-from gpio import gpio_chip_test
-from firmware_upgrade import fboss_firmware_test
 
 def arg_parser():
     """Parses command-line arguments."""
@@ -112,6 +105,7 @@ class TestFboss(unittest.TestCase):
 
     def test_iob_xadc(self):
         """Tests the IOB XADC registers."""
+        from xadc import test_iob_xadc
         test_iob_xadc()
 
     def test_spi_udev(self):
@@ -137,32 +131,39 @@ class TestFboss(unittest.TestCase):
 
     def test_gpio(self):
         """Test GPIO chip."""
+        from gpio import gpio_chip_test
         gpio_chip_test()
 
     def test_port_led(self):
         """Test port LED status."""
+        from leds import port_led_status_test
         port_led_status_test()
 
     def test_loop_leds(self):
         """Test port LED loop."""
+        from leds import port_led_loop_test
         port_led_loop_test()
 
     def test_xcvrs(self):
         """Test XCVRs."""
+        from xcvr import XcvrManager
         xcvr_manager = XcvrManager()
         xcvr_manager.test_xcvr_devices()
 
     def test_sensors(self):
         """Test sensors."""
+        from sensor import sensor_test
         sensor_test()
 
     def test_hwmon(self):
         """Test HWMON."""
+        from hwmon import Hwmon
         hwmon = Hwmon()
         hwmon.hwmon_test()
 
     def test_firmware_upgrade(self):
         """Test firmware upgrade."""
+        from firmware_upgrade import fboss_firmware_test
         fboss_firmware_test()
 
 
@@ -2,6 +2,7 @@
 
 import os
 import re
+import sys
 import csv
 from pathlib import Path
 
@@ -18,6 +19,7 @@ MUX_DEV_PATH = (
     "/sys/bus/auxiliary/devices/{}.{}_i2c_master.{}/i2c-{}/{}-0070/channel-{}"
 )
 CPU_TEMP = "/sys/devices/platform/coretemp.0/hwmon"
+I2C_BUS_PATTERN = re.compile(r"i2c-(\d+)", re.M)
 
 
 # Sensor data structure (more organized)
@@ -26,6 +28,19 @@ class Sensor:
     Represents a sensor with its attributes.
     """
 
+    __slots__ = (
+        "sensor_name",
+        "local",
+        "busid",
+        "addr",
+        "sysfs_link",
+        "position",
+        "coefficient",
+        "unit",
+        "maxval",
+        "minval",
+    )
+
     def __init__(
         self,
         sensor_name,
@@ -74,9 +89,9 @@ class Sensor:
         """
         # Use pathlib to iterate over files in the directory
         for file in Path(directory).iterdir():
-            dev = re.findall(r"i2c-\d+", file.name, re.M)
+            dev = I2C_BUS_PATTERN.search(file.name)
             if dev:
-                return dev[0].split("-")[1]
+                return dev.group(1)
         return None
 
     def _read_sensor_data(self):
@@ -99,7 +114,7 @@ class Sensor:
         """
         Reads sensor data from the sysfs link.
         """
-        if not Path(file_path).exists():
+        if not os.path.exists(file_path):
             return None
         with open(file_path, "r") as f:
             sensor_data = f.read().strip()
@@ -122,7 +137,7 @@ class Sensor:
         else:
             bus_path = I2C_PATH.format(IOB_PCI_DRIVER, local, self.busid)
 
-        if Path(bus_path).exists():
+        if os.path.exists(bus_path):
             devid = self.get_i2c_bus(bus_path)
             if "mux_" in local:
                 tmp_path = MUX_DEV_PATH.format(
@@ -139,7 +154,7 @@ class Sensor:
                 )
                 if local == "COME":
                     dev_path = CPU_TEMP
-                if Path(dev_path).exists():
+                if os.path.exists(dev_path):
                     for dirs in Path(dev_path).iterdir():
                         dev_file = f"{dev_path}/{dirs.name}/{dev_name}"
                 else:
@@ -222,26 +237,29 @@ def sensor_data(sensors):
     """
     Tests the sensors based on the provided configuration.
     """
-    print(
-        "--------------------+-------+-----+------+--------+---------+---------+------+-------\n"
-        "  Sensor rail name  | Local | Bus | Addr |  Data  | Max val | Min val | Unit | Status\n"
-        "--------------------+-------+-----+------+--------+---------+---------+------+-------"
-    )
+    separator = "-" * 20 + "+-------+-----+------+--------+---------+---------+------+-------"
+    lines = [
+        separator,
+        "  Sensor rail name  | Local | Bus | Addr |  Data  | Max val | Min val | Unit | Status",
+        separator,
+    ]
 
     for sensor in sensors:
         status = PASS
         data, status = sensor.test_sensor_data()
         if status:
 
-            print(
+            lines.append(
                 f'{"":2}{sensor.sensor_name[:17]:<18}{"|":<2}{sensor.local[:4]:<4}{"":>2}{"|":<2}'
                 + f'{sensor.busid:<4}{"|":<2}{sensor.addr:<5}{"|":<2}'
                 + f'{data:<7}{"|":<2}{str(sensor.maxval):<8}{"|":<2}'
                 + f'{str(sensor.minval):<8}{"|":<2}{sensor.unit:<5}{"|":<2}{status:<5}'
             )
-        print(
-            "--------------------+-------+-----+------+--------+---------+---------+------+-------"
-        )
+        lines.append(separator)
+
+    # Emit the whole table with a single write
+    lines.append("")
+    sys.stdout.write("\n".join(lines))
     return status
 
 
@@ -32,9 +32,12 @@ def spidev_bind(spi_id, spi_chardev):
 
 def flash_do_io(spidev, chip, io_type, io_file):
     """Read/Write/Verify flashes using flashrom."""
-    command = f"flashrom -p linux_spi:dev={spidev} -c {chip} -{io_type} {io_file}"
-    print(command)
-    subprocess.run(command, shell=True)
+    command = ["flashrom", "-p", f"linux_spi:dev={spidev}", "-c", chip, f"-{io_type}", io_file]
+    print(" ".join(command))
+    try:
+        subprocess.run(command, check=False)
+    except OSError as err:
+        print(f"Failed to run flashrom: {err}")
 
 def select_dom1():
     """Select DOM1 flash."""
@@ -178,7 +181,10 @@ def release_comemic():
 
 def set_gpio(chip, pin, value):
     """Set GPIO pin value."""
-    subprocess.run(f"gpioset {chip} {pin}={value}", shell=True)
+    try:
+        subprocess.run(["gpioset", chip, f"{pin}={value}"], check=False)
+    except OSError as err:
+        print(f"Failed to run gpioset: {err}")
 
 def generate_binary_file(user_file, flash_size):
     """Generate full size binary file for CPLD flashes."""
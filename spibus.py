@@ -1,7 +1,6 @@
 """Module providing spi master and spidev test."""
 
 import os
-import pathlib
 import re
 from ast import literal_eval
 from typing import Dict, List, Tuple
@@ -12,6 +11,7 @@ IOB_PCI_DRIVER="fbiob_pci"
 
 DEVMAP_SPI = "/run/devmap/flashes/"
 SPI_VENDOR_PATTERN = re.compile(r"vendor=\"([\w\d]+)\"\sname=\"([\w\d.]+)\"")
+SPI_BUS_ID_PATTERN = re.compile(r"\d+?d*")
 
 FMTOUT = "\u001b[31m{}\u001b[0m"
 
@@ -22,9 +22,9 @@ def generate_spidev():
         drv_path = f"/sys/bus/spi/devices/spi{busid}.0/driver_override"
         dev_path = f"/dev/spidev{busid}.0"
         bind_path = "/sys/bus/spi/drivers/spidev/bind"
-        if not pathlib.Path(drv_path).exists() or not pathlib.Path(bind_path).exists():
+        if not os.path.exists(drv_path) or not os.path.exists(bind_path):
             break
-        if not pathlib.Path(dev_path).exists():
+        if not os.path.exists(dev_path):
             with open(drv_path, "w", encoding="utf-8") as fd:
                 fd.write("spidev")
             with open(bind_path, "w", encoding="utf-8") as fd:
@@ -37,14 +37,18 @@ class SPIBUS:
     def __init__(self, spi_info: Dict, fpga_path: str):
         self._fpga_path = fpga_path
         self.spi_dict = spi_info
+        # bus id -> flash config, first entry wins like the original scan
+        self._spi_by_bus = {}
+        for value in (spi_info or {}).values():
+            self._spi_by_bus.setdefault(value["bus"], value)
         generate_spidev()
 
     def _get_spidev_from_udev(self, spidev_name: str) -> Tuple[bool, str]:
         """get spidev info."""
         dev_name = f"{DEVMAP_SPI}{spidev_name}"
-        if pathlib.Path(dev_name).exists():
+        if os.path.exists(dev_name):
             chardev = os.readlink(dev_name)
-            if pathlib.Path(chardev).exists():
+            if os.path.exists(chardev):
                 spidev_info = os.path.basename(chardev)
                 return True, spidev_info
         return False, "NA"
@@ -58,27 +62,21 @@ class SPIBUS:
 
     def parse_spidev_udev(self, busid: int) -> Tuple[bool, str, str]:
         """parse spidev info."""
-        spidev_info = ""
-        spidev_udev = ""
-        udev_flag = False
         # get spi flash device udev
-        if not pathlib.Path(DEVMAP_SPI).exists():
+        if not os.path.exists(DEVMAP_SPI):
             return False, "NA", "NA"
-        spi_udev = os.listdir(DEVMAP_SPI)
-        for value in self.spi_dict.values():
-            if busid == value["bus"]:
-                udev_flag = True
-                spidev_udev = value["udev"]
-                if spidev_udev in spi_udev:
-                    sta, spidev_dev = self._get_spidev_from_udev(spidev_udev)
-                    if not sta:
-                        return False, FMTOUT.format("FAIL - udev Invalid."), "NA"
-                    spidev_info = re.findall(r"\d+?d*", spidev_dev)[0]
-                    return True, spidev_info, spidev_udev
-                return False, FMTOUT.format(f"FAIL - match error {spi_udev}."), "NA"
-        if not udev_flag:
+        value = self._spi_by_bus.get(busid)
+        if value is None:
             return True, str(busid), "NA"
-        return False, "NA", "NA"
+        spi_udev = os.listdir(DEVMAP_SPI)
+        spidev_udev = value["udev"]
+        if spidev_udev in spi_udev:
+            sta, spidev_dev = self._get_spidev_from_udev(spidev_udev)
+            if not sta:
+                return False, FMTOUT.format("FAIL - udev Invalid."), "NA"
+            spidev_info = SPI_BUS_ID_PATTERN.search(spidev_dev).group(0)
+            return True, spidev_info, spidev_udev
+        return False, FMTOUT.format(f"FAIL - match error {spi_udev}."), "NA"
 
     def spi_master_detect(self) -> Tuple[bool, str]:
         """detect spi master info."""
@@ -87,12 +85,12 @@ class SPIBUS:
             dev_path = f"/sys/bus/spi/devices/spi{busid}.0"
             master_path = f"{self._fpga_path}{IOB_PCI_DRIVER}.spi_master.{busid}"
 
-            if pathlib.Path(dev_path).exists() and pathlib.Path(master_path).exists():
+            if os.path.exists(dev_path) and os.path.exists(master_path):
                 cmd_str = f"basename {dev_path}"
                 sta, res = execute_shell_cmd(cmd_str)
                 if sta:
                     spibus = res.split()[0]
-                    masterid = re.findall(r"\d+?d*", spibus)[0]
+                    masterid = SPI_BUS_ID_PATTERN.search(spibus).group(0)
                     spidev_info = f"spidev{masterid}.0"
                 else:
                     errcode = False
@@ -152,10 +150,10 @@ class SPIBUS:
         stat, stdout = execute_shell_cmd(cmd)
         if not stat:
             return False
-        try:
-            vendor, name = SPI_VENDOR_PATTERN.findall(stdout.splitlines()[-1])[0]
-        except ValueError:
+        vendor_match = SPI_VENDOR_PATTERN.search(stdout.splitlines()[-1])
+        if not vendor_match:
             return False
+        vendor, name = vendor_match.groups()
         cmd = (
             f"flashrom -p linux_spi:dev={spidev} -c"
             + f' {self.spi_dict[dev]["chip"]} --flash-size'
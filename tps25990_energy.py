@@ -27,6 +27,7 @@ MV_16BIT = 2**16
 # Device path format
 IOB_PCI_DRIVER="fbiob_pci"
 DEVPATH = "/sys/bus/auxiliary/devices/{}.iob_i2c_master.{}/"
+I2C_BUS_PATTERN = re.compile(r"i2c-(\d+)", re.M)
 
 def read_energy_data(bus_id, raw_data=False):
     """Reads energy data from an I2C device.
@@ -197,9 +198,9 @@ def get_i2c_bus(directory):
     files = os.listdir(directory)
 
     for file in files:
-        dev = re.findall(r"i2c-\d+", file, re.M)
+        dev = I2C_BUS_PATTERN.search(file)
         if dev:
-            return dev[0].split("-")[1]
+            return dev.group(1)
 
     return None
 
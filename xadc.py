@@ -3,8 +3,8 @@
 import mmap
 import struct
 import contextlib
-import subprocess
-from typing import Tuple, Optional
+
+from fboss_utils import get_pci_bdf_info
 
 # Constants for XADC registers
 XADC_TEMP = [0x200, 0x280, 0x290]
@@ -27,40 +27,11 @@ BDF_PATH = "/sys/bus/pci/devices/0000:{}/"
 import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def execute_shell_cmd(cmd: str) -> Tuple[bool, str]:
-    """Executes a shell command and returns the status and output."""
-    try:
-        result = subprocess.run(
-            cmd.split(), stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=False
-        )
-        if result.returncode == 0:
-            return True, result.stdout.decode().strip()
-        else:
-            logging.error(f"Command '{cmd}' failed with error code {result.returncode}")
-            return False, (
-                result.stdout.decode().strip()
-                + f"\n- Error Code: {result.returncode}\n- Error:\n"
-                + result.stderr.decode().strip()
-            )
-    except FileNotFoundError as fne:
-        logging.error(f"Command '{cmd}' failed: {fne.strerror}")
-        return False, fne.strerror + f": {cmd}"
-
-def get_pci_bdf_info(vendor_id: str) -> Optional[str]:
-    """Retrieves the PCI Bus, Device, and Function (BDF) information for a device with the given vendor ID."""
-    status, stdout = execute_shell_cmd("lspci -n")
-    if not status:
-        return None
-    for line in stdout.splitlines():
-        if vendor_id in line:
-            return line.split()[0]
-    logging.warning(f"PCI device with vendor ID '{vendor_id}' not found.")
-    return None
-
 def get_fpga_path():
     """Gets the FPGA path based on its PCI BDF."""
     fpga_bdf = get_pci_bdf_info(IOB_DEV_ID)
     if fpga_bdf is None:
+        logging.warning(f"PCI device with vendor ID '{IOB_DEV_ID}' not found.")
         return None
     return f"{BDF_PATH}".format(fpga_bdf)
 